@@ -1,12 +1,108 @@
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
+from reportlab.lib.utils import ImageReader
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import os
+import gc
+import json
+import shutil
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import repeat
+
+_NUMBER = (int, float)
+
+
+def _check_numerical(labels):
+    if not isinstance(labels, _NUMBER):
+        raise ValueError("For numerical metrics, values must be int or float.")
+
+
+def _check_categorical(labels):
+    if not isinstance(labels, dict):
+        raise ValueError("For categorical metrics, values must be a dictionary.")
+    for label, value in labels.items():
+        if not isinstance(label, str):
+            raise ValueError("Each key in the labels dictionary must be a string.")
+        if not isinstance(value, _NUMBER):
+            raise ValueError("Each value in the labels dictionary must be an int or float.")
+
+
+# Per-type check for the values of the "models" dictionary, resolved once per item.
+_MODEL_VALUE_CHECKS = {
+    "numerical": _check_numerical,
+    "categorical": _check_categorical,
+}
+
+
+def _fingerprint(data):
+    """
+    Returns a content digest of ``data``, or None if it cannot be serialized.
+
+    Pickle keeps exact types (``1`` vs ``"1"`` vs ``1.0``), so two payloads only
+    share a digest when they would also validate identically.
+    """
+    try:
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+# Digests of payloads that already passed validation, in LRU order.
+_VALIDATION_CACHE_SIZE = 128
+_validated = OrderedDict()
+_validated_lock = threading.Lock()
+
 
 def validate_data_format(data):
     """
     Validates the structure of the given data format.
+
+    Payloads that already passed validation are remembered by content digest,
+    so repeated reports on identical data skip the traversal.
+    """
+    return _validate_with_cache(data, _fingerprint(data))
+
+
+def clear_validation_cache():
+    """Forgets every payload remembered by ``validate_data_format``."""
+    with _validated_lock:
+        _validated.clear()
+
+
+def _validate_with_cache(data, fingerprint):
+    """Validates ``data`` unless its precomputed ``fingerprint`` already passed."""
+    if fingerprint is not None:
+        with _validated_lock:
+            if fingerprint in _validated:
+                _validated.move_to_end(fingerprint, last=True)
+                return True
+
+    _validate_data_format(data)
+
+    if fingerprint is not None:
+        with _validated_lock:
+            _validated[fingerprint] = True
+            if len(_validated) > _VALIDATION_CACHE_SIZE:
+                _validated.popitem(last=False)
+    return True
+
+
+def _validate_data_format(data):
+    """
+    Validates the structure of the given data format.
+
+    Every item is checked in a single traversal: the metric type selects the
+    value check once, instead of re-testing it for every model entry.
     """
     if not isinstance(data, list):
         raise ValueError("Data must be a list.")
@@ -14,99 +110,134 @@ def validate_data_format(data):
     for item in data:
         if not isinstance(item, dict):
             raise ValueError("Each item in data must be a dictionary.")
-        
-        # Validate "name"
-        if "name" not in item or not isinstance(item["name"], str):
+
+        if not isinstance(item.get("name"), str):
             raise ValueError("Each item must have a 'name' key with a string value.")
-        
-        # Validate "type"
-        if "type" not in item or not isinstance(item["type"], str):
+
+        if not isinstance(item.get("type"), str):
             raise ValueError("Each item must have a 'type' key with a string value.")
-        
-        if item["type"] not in ["categorical", "numerical"]:
+
+        check_value = _MODEL_VALUE_CHECKS.get(item["type"])
+        if check_value is None:
             raise ValueError("The 'type' must be either 'categorical' or 'numerical'.")
-        
-        # Validate "models"
-        if "models" not in item or not isinstance(item["models"], dict):
+
+        if not isinstance(item.get("models"), dict):
             raise ValueError("Each item must have a 'models' key with a dictionary value.")
-        
-        # Validate the "models" dictionary
+
         for model_name, labels in item["models"].items():
             if not isinstance(model_name, str):
                 raise ValueError("Each key in 'models' must be a string representing a model name.")
-            
-            if item["type"] == "numerical" and not isinstance(labels, (int, float)):
-                raise ValueError("For numerical metrics, values must be int or float.")
-            
-            if item["type"] == "categorical" and not isinstance(labels, dict):
-                raise ValueError("For categorical metrics, values must be a dictionary.")
-            
-            if item["type"] == "categorical":
-                for label, value in labels.items():
-                    if not isinstance(label, str):
-                        raise ValueError("Each key in the labels dictionary must be a string.")
-                    
-                    if not isinstance(value, (int, float)):
-                        raise ValueError("Each value in the labels dictionary must be an int or float.")
-    
+            check_value(labels)
+
     return True
 
-def generate_metric_plot(metric_name, metric_type, models):
+@lru_cache(maxsize=64)
+def _paired(n):
+    """Samples ``n`` colors from the Paired colormap; the palette depends only on ``n``."""
+    return matplotlib.colormaps["Paired"](np.linspace(0, 1, n))
+
+def _plot_cache_path(cache_dir, metric_name, metric_type, models):
+    """Returns the cache file for a plot, keyed by everything that affects its pixels."""
+    payload = json.dumps([metric_name, metric_type, models]).encode()
+    key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"{key}.png")
+
+def generate_metric_plot(metric_name, metric_type, models, cache_dir=None):
     """
     Generates a plot for a single metric based on its type and model data.
+
+    Figures are built directly on the Agg canvas rather than through pyplot,
+    so no global figure state is kept between plots. The PNG is returned as an
+    in-memory buffer instead of being written to disk.
+
+    When ``cache_dir`` is given, rendered plots are cached there and reused
+    when the same metric data is plotted again. By default nothing is cached.
     """
-    plot_file = f"{metric_name.replace(' ', '_')}_plot.png"
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _plot_cache_path(cache_dir, metric_name, metric_type, models)
+        if os.path.exists(cache_path):
+            with open(cache_path, "rb") as file:
+                return BytesIO(file.read())
+
+    buffer = BytesIO()
     
     if metric_type == "numerical":
         # Bar chart for numerical metrics
         model_names = list(models.keys())
         values = list(models.values())
-        colors = plt.cm.Paired(np.linspace(0, 1, len(model_names)))
+        colors = _paired(len(model_names))
         
-        plt.figure(figsize=(8, 5))
-        plt.bar(model_names, values, color=colors)
-        plt.xlabel("Models")
-        plt.ylabel("Value")
-        # plt.title(f"Numerical Metric: {metric_name}")
-        plt.tight_layout()
-        plt.savefig(plot_file)
-        plt.close()
+        fig = Figure(figsize=(8, 5), layout="constrained")
+        plot_canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        ax.bar(model_names, values, color=colors)
+        ax.set_xlabel("Models")
+        ax.set_ylabel("Value")
+        # ax.set_title(f"Numerical Metric: {metric_name}")
+        plot_canvas.print_png(buffer)
+        del fig, plot_canvas
     
     elif metric_type == "categorical":
         # Stacked bar chart for categorical metrics
-        labels = set(label for model in models.values() for label in model.keys())
+        labels = list(dict.fromkeys(label for model in models.values() for label in model))
         label_indices = {label: i for i, label in enumerate(labels)}
         
         model_names = list(models.keys())
         data = np.zeros((len(model_names), len(labels)))
         
-        for i, model in enumerate(model_names):
-            for label, count in models[model].items():
-                data[i, label_indices[label]] = count
+        # Scatter-add all (model, label, count) triples from flat index arrays
+        size = sum(len(models[model]) for model in model_names)
+        rows = np.fromiter(
+            (i for i, model in enumerate(model_names) for _ in models[model]),
+            dtype=np.intp, count=size,
+        )
+        cols = np.fromiter(
+            (label_indices[label] for model in model_names for label in models[model]),
+            dtype=np.intp, count=size,
+        )
+        counts = np.fromiter(
+            (count for model in model_names for count in models[model].values()),
+            dtype=float, count=size,
+        )
+        np.add.at(data, (rows, cols), counts)
         
         indices = np.arange(len(model_names))
         bar_width = 0.8 / len(labels)
         
-        plt.figure(figsize=(10, 6))
+        fig = Figure(figsize=(10, 6), layout="constrained")
+        plot_canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
         for i, label in enumerate(labels):
-            plt.bar(indices + i * bar_width, data[:, i], bar_width, label=label)
+            ax.bar(indices + i * bar_width, data[:, i], bar_width, label=label)
         
-        plt.xlabel("Models")
-        plt.ylabel("Count")
-        # plt.title(f"Categorical Metric: {metric_name}")
-        plt.xticks(indices + bar_width * (len(labels) / 2), model_names, rotation=45, ha="right")
-        plt.legend(title="Categories")
-        plt.tight_layout()
-        plt.savefig(plot_file)
-        plt.close()
+        ax.set_xlabel("Models")
+        ax.set_ylabel("Count")
+        # ax.set_title(f"Categorical Metric: {metric_name}")
+        ax.set_xticks(indices + bar_width * (len(labels) / 2), model_names, rotation=45, ha="right")
+        ax.legend(title="Categories")
+        plot_canvas.print_png(buffer)
+        del fig, plot_canvas
     
-    return plot_file
+    if cache_path is not None:
+        # Write then rename so concurrent renderers never see a partial file
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(buffer.getvalue())
+        os.replace(tmp_path, cache_path)
+
+    buffer.seek(0)
+    return buffer
+
+# File the finished report is written to, in the working directory.
+REPORT_FILE_NAME = "model_comparison_report.pdf"
 
 def generate_pdf_report(data, plot_files):
     """
     Generates a PDF report with plots for each metric.
     """
-    file_name = "model_comparison_report.pdf"
+    file_name = REPORT_FILE_NAME
     c = canvas.Canvas(file_name, pagesize=letter)
     c.setFont("Helvetica", 12)
     c.drawString(100, 750, "Model Comparison Report")
@@ -114,7 +245,7 @@ def generate_pdf_report(data, plot_files):
     y_position = 700
     for metric_name, plot_file in plot_files:
         c.drawString(50, y_position, metric_name)
-        c.drawImage(plot_file, 50, y_position - 310, width=500, height=300)
+        c.drawImage(ImageReader(plot_file), 50, y_position - 310, width=500, height=300)
         y_position -= 350
         if y_position < 100:
             c.showPage()
@@ -122,22 +253,65 @@ def generate_pdf_report(data, plot_files):
 
     c.save()
 
-    # Clean up plot files
-    for _, plot_file in plot_files:
-        os.remove(plot_file)
-
     return file_name
 
-def generate_report(data):
-    """Generate a detailed report with individual metric plots."""
-    validate_data_format(data)
+def _render_one(item, cache_dir=None):
+    """Renders the plot for a single metric item."""
+    return generate_metric_plot(item["name"], item["type"], item["models"], cache_dir=cache_dir)
+
+def generate_report(data, max_workers=None, cache_dir=None, plot_cache_dir=None):
+    """Generate a detailed report with individual metric plots.
+
+    The report is always written to ``model_comparison_report.pdf``, whose
+    name is returned. Caching is opt-in:
+
+    - ``cache_dir`` keeps a copy of every finished report under a digest of
+      ``data``; a repeated call with identical data copies it back without
+      validating or rendering anything.
+    - ``plot_cache_dir`` is passed to ``generate_metric_plot`` so unchanged
+      metrics reuse their rendered PNG.
+
+    Plots are rendered in the calling process by default. Pass
+    ``max_workers`` greater than 1 to render them in that many worker
+    processes instead; under the ``spawn`` start method (the default on macOS
+    and Windows) the calling script must then guard its entry point with
+    ``if __name__ == "__main__":``.
+
+    Plots never go through pyplot, so no figure outlives the report; callers
+    should not mix pyplot calls into these helpers, since pyplot keeps every
+    figure it creates alive until it is explicitly closed.
+    """
+    # Digest the payload once; it keys both the report and the validation cache
+    fingerprint = _fingerprint(data)
+
+    cache_path = None
+    if cache_dir is not None and fingerprint is not None:
+        cache_path = os.path.join(cache_dir, f"{fingerprint.hex()}.pdf")
+        if os.path.exists(cache_path):
+            shutil.copyfile(cache_path, REPORT_FILE_NAME)
+            return REPORT_FILE_NAME
+
+    _validate_with_cache(data, fingerprint)
     
     # Generate plots for each metric
-    plot_files = []
-    for item in data:
-        plot_file = generate_metric_plot(item["name"], item["type"], item["models"])
-        plot_files.append((item["name"], plot_file))
+    workers = min(max_workers or 1, len(data))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            plots = list(executor.map(_render_one, data, repeat(plot_cache_dir)))
+    else:
+        plots = [_render_one(item, plot_cache_dir) for item in data]
+    plot_files = [(item["name"], plot) for item, plot in zip(data, plots)]
     
+    # Release the figures once per report rather than once per plot
+    gc.collect()
+
     # Generate the PDF report
     pdf_file = generate_pdf_report(data, plot_files)
+
+    if cache_path is not None:
+        # Copy then rename so concurrent reports never see a partial file
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        shutil.copyfile(pdf_file, tmp_path)
+        os.replace(tmp_path, cache_path)
     return pdf_file
@@ -1,31 +1,57 @@
-def run_predictions(eval_dataset, models):
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from ..results_manager import Result
+
+
+def run_predictions(eval_dataset, models, max_workers=64, output_file=None):
     """
     Run predictions on evaluation dataset using provided models.
-    
+
+    Every prediction is a network round-trip, so all (model, item) pairs are
+    dispatched concurrently on a thread pool. Results keep dataset order.
+
     Args:
         eval_dataset: Dataset to evaluate models on
         models: List of models to compare
-        
+        max_workers: Maximum number of predictions in flight at once
+        output_file: Optional JSON Lines file each prediction is appended to
+            as soon as it completes, as {"model", "index", "input", "prediction"}
+
     Returns:
         dict: Dictionary containing prediction results for each model
     """
+    items = list(eval_dataset)
+    predictions = {}
 
-    results = {}
-    
-    for model in models:
-        model_predictions = []
-        
-        for item in eval_dataset:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(model.predict, item): (model, index)
+            for model in models
+            for index, item in enumerate(items)
+        }
+        for future in as_completed(futures):
+            model, index = futures[future]
             try:
-                prediction = model.predict(item)
-                model_predictions.append({
-                    'input': item,
-                    'prediction': prediction
-                })
+                predictions[model, index] = future.result()
             except Exception as e:
                 print(f"Error running prediction for model {model}: {str(e)}")
                 continue
-                
-        results[model.name] = model_predictions
-    
+            if output_file is not None:
+                Result.append({
+                    'model': model.model_name,
+                    'index': index,
+                    'input': items[index],
+                    'prediction': predictions[model, index]
+                }, output_file)
+
+    results = {}
+    for model in models:
+        results[model.model_name] = [
+            {
+                'input': item,
+                'prediction': predictions[model, index]
+            }
+            for index, item in enumerate(items)
+            if (model, index) in predictions
+        ]
+
     return results
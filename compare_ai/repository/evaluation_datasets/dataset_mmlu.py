@@ -1,11 +1,31 @@
-from typing import Dict, Any
-from datasets import load_dataset
+import os
+import shutil
+import hashlib
+from typing import Dict, Any, List, Optional
+import pyarrow as pa
+import pyarrow.compute as pc
+from datasets import Dataset, load_dataset, load_from_disk
+from datasets.table import InMemoryTable
 from .dataset import TextGenerationEvaluationDataset
 
+# Answer letters indexed by the integer class label used in cais/mmlu.
+ANSWER_LETTERS = pa.array(["A", "B", "C", "D"])
+
 class MMLUDataset(TextGenerationEvaluationDataset):
     """MMLU (Massive Multitask Language Understanding) dataset implementation."""
     
-    def __init__(self,system_prompts=["","You are an expert academic assistant who answers questions precisely and accurately"] ):
+    def __init__(self,system_prompts=["","You are an expert academic assistant who answers questions precisely and accurately"], cache_dir: Optional[str] = None, subjects: Optional[List[str]] = None):
+        """
+        Nothing is loaded on construction; call ``preprocess()`` (which loads
+        on first use) or ``load()`` explicitly.
+
+        Args:
+            system_prompts: System prompts to build one input set for each
+            cache_dir: Optional directory where the loaded test split is saved
+                       and memory-mapped on later loads. None (the default)
+                       disables the cache.
+            subjects: Optional list of MMLU subjects to keep; all subjects by default
+        """
         super().__init__(
             name="MMLU",
             description="Massive Multitask Language Understanding benchmark",
@@ -13,39 +33,149 @@ class MMLUDataset(TextGenerationEvaluationDataset):
             inputs=[]
         )
         self.system_prompts = system_prompts
+        self.cache_dir = cache_dir
+        self.subjects = subjects
+        self._loaded = False
 
-        self.load()
-        self.preprocess()
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Return a single entry as a dict, decoded from the columnar store on access."""
+        return self.entries[index]
 
     def load(self) -> None:
-        """Load MMLU dataset from Hugging Face's CAIS format."""
+        """Load MMLU dataset from Hugging Face's CAIS format.
+
+        When ``cache_dir`` is set, the test split is saved there after the
+        first load, so later loads memory-map the Arrow files instead of
+        resolving and preparing the dataset again. A cache that cannot be read
+        is treated as a miss and rewritten. Calling it again is a no-op.
+        """
+        if self._loaded:
+            return
+
+        cache_path = os.path.join(self.cache_dir, self._cache_name()) if self.cache_dir else None
+        if cache_path and os.path.isdir(cache_path):
+            try:
+                self.entries = load_from_disk(cache_path)
+                self._loaded = True
+                return
+            except Exception:
+                # Partial or corrupt cache; fall through and rebuild it
+                pass
+
         try:
             dataset = load_dataset("cais/mmlu", "all")
-            self.entries = dataset["test"]
+            test = dataset["test"]
+            if self.subjects:
+                subject_set = frozenset(self.subjects)
+                # Batched so the membership test runs once per batch, not per row
+                test = test.filter(
+                    lambda batch: [subject in subject_set for subject in batch["subject"]],
+                    batched=True,
+                    batch_size=4096,
+                    load_from_cache_file=True,
+                )
+            self.entries = self._with_letter_answers(test)
         except Exception as e:
             raise RuntimeError(f"Failed to load MMLU dataset: {str(e)}")
+
+        if cache_path:
+            self._save_cache(cache_path)
+        self._loaded = True
         
+    def validate(self) -> bool:
+        """Check that every entry has four choices and an answer letter (A-D).
+
+        Arrow-backed entries are checked with vectorized compute kernels; a
+        plain list of entry dicts falls back to a per-entry check.
+        """
+        if isinstance(self.entries, list):
+            valid_answers = set(ANSWER_LETTERS.to_pylist())
+            return all(
+                isinstance(entry.get("choices"), list)
+                and len(entry["choices"]) == 4
+                and entry.get("answer") in valid_answers
+                for entry in self.entries
+            )
+
+        table = self.entries.with_format("arrow")[:]
+        answers_valid = pc.is_in(table.column("answer"), value_set=ANSWER_LETTERS)
+        choices_valid = pc.equal(pc.list_value_length(table.column("choices")), 4)
+        return all(
+            pc.all(pc.fill_null(mask, False), min_count=0).as_py()
+            for mask in (answers_valid, choices_valid)
+        )
+
+    def _save_cache(self, cache_path: str) -> None:
+        """Save the entries to ``cache_path`` via a temp directory, so an
+        interrupted save never leaves a partial cache in place."""
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        self.entries.save_to_disk(tmp_path)
+        # os.replace cannot overwrite a non-empty directory, so drop a stale one first
+        shutil.rmtree(cache_path, ignore_errors=True)
+        try:
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Another process published the cache first
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def _cache_name(self) -> str:
+        """Name of the on-disk cache for the selected subjects."""
+        if not self.subjects:
+            return "test"
+        key = hashlib.sha1(repr(sorted(self.subjects)).encode()).hexdigest()
+        return f"test-{key}"
+
+    @staticmethod
+    def _with_letter_answers(dataset: Dataset) -> Dataset:
+        """Replace the integer answer labels with their letters (A-D).
+
+        The mapping is a single Arrow ``take`` over the answer column, so the
+        rows are never materialized as Python objects.
+        """
+        table = dataset.with_format("arrow")[:]
+        answers = ANSWER_LETTERS.take(table.column("answer"))
+        table = table.set_column(table.schema.get_field_index("answer"), "answer", answers)
+        # Drop the stored features so "answer" is read back as a string column
+        return Dataset(InMemoryTable(table.replace_schema_metadata(None)))
+
     def preprocess(self) -> Dict[str, Any]:
-        """Preprocess the MMLU dataset."""
+        """Preprocess the MMLU dataset, loading it first if needed."""
+        self.load()
 
+        # Prompts do not depend on the system prompt, so build them only once
+        entries = list(self.entries)
+        prompts = [self._generate_prompt(entry) for entry in entries]
 
         self.inputs = [
-            self._preprocess_entries(system_promt=item) for item in self.system_prompts
+            self._preprocess_entries(entries, prompts, system_prompt=item) for item in self.system_prompts
         ]        
     
-    def _preprocess_entries(self, system_promt="") -> Dict[str, Any]:
-        """Preprocess the dataset entries."""
+    @staticmethod
+    def _generate_prompt(example: Dict[str, Any]) -> str:
+        """Build the question prompt for a single entry."""
+        question = example["question"]
+        choices = "\n".join(example["choices"])
+        return f"Question: {question}\nOptions:\n{choices}\nAnswer with the correct option (A, B, C, or D)."
 
+    def _preprocess_entries(self, entries, prompts, system_prompt="") -> List[Dict[str, Any]]:
+        """Pair each entry with its prompt and the given system prompt.
 
-        def generate_prompt(example):
-            question = example["question"]
-            choices = "\n".join(example["choices"])
-            prompt = f"Question: {question}\nOptions:\n{choices}\nAnswer with the correct option (A, B, C, or D)."
-            example["prompt"] = prompt
-            example["system_prompt"] = system_promt
-            return example
-        
-        return [generate_prompt(entry) for entry in self.entries]
+        ``messages`` always opens with the same system message, verbatim, so
+        every request of an input set shares a prefix the provider can cache.
+        """
+        system_messages = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        return [
+            {
+                **entry,
+                "prompt": prompt,
+                "system_prompt": system_prompt,
+                "messages": system_messages + [{"role": "user", "content": prompt}],
+            }
+            for entry, prompt in zip(entries, prompts)
+        ]
 
     
     def postprocess(self) -> None:
@@ -1,10 +1,10 @@
 from .definitions import TaskType
-from .provider import Provider
+from .provider import BaseProvider, Provider
 from .models import Model, ModelCapability
 from .model_registry import ModelRegistry
 from .provider_factory import ProviderFactory
 
-__all__ = ['Model', 'ModelCapability', 'Provider', 'TaskType', 'ModelRegistry', 'ProviderFactory']
+__all__ = ['Model', 'ModelCapability', 'Provider', 'BaseProvider', 'TaskType', 'ModelRegistry', 'ProviderFactory']
 
 """
 Models Package
@@ -16,7 +16,8 @@ Key Components:
 -------------
 - TaskType: Enum defining supported AI tasks (classification, generation, etc.)
 - Model: Base class representing an AI model with its metadata and capabilities
-- Provider: Class representing an AI model provider/vendor
+- Provider: Protocol describing an AI model provider/vendor
+- BaseProvider: Optional base class with the shared provider ``__init__``
 
 Example Usage:
 ------------
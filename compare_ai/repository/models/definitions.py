@@ -1,6 +1,4 @@
 from enum import Enum
-from typing import Dict, Set, List, Optional, Any
-from dataclasses import dataclass
 
 class TaskType(Enum):
     TEXT_GENERATION = "text_generation"
@@ -1,8 +1,13 @@
-from typing import Dict, List, Optional, Set, Any
+from __future__ import annotations
+from typing import Optional, Any
 from .models import Model
 from .definitions import TaskType
 from .provider_factory import ProviderFactory
-from .provider import Provider
+from .provider import Provider, provider_iter_models
+from concurrent.futures import ThreadPoolExecutor
+
+# Upper bound on providers created concurrently at registry start-up.
+MAX_PROVIDER_WORKERS = 8
 
 class ModelRegistry:
     """Central registry for managing AI model providers and their models.
@@ -31,56 +36,91 @@ class ModelRegistry:
     ```
     """
 
-    def __init__(self, config: Optional[Dict[str, Dict[str, Any]]] = None):
+    def __init__(self, config: Optional[dict[str, dict[str, Any]]] = None):
         """Initialize the model registry.
         
         Args:
             config: Optional configuration dictionary for providers
                    Format: {"provider_name": {"config_key": "value"}}
         """
-        self._models: Dict[str, Model] = {}
-        self._providers: Dict[str, Provider] = {}
+        self._models: dict[str, Model] = {}
+        self._providers: dict[str, Provider] = {}
+        # Inverted indexes in registration order. Every model is keyed by its
+        # provider, name and task, so models sharing a name across providers
+        # are all kept: provider name -> {(model_name, task): Model} and
+        # task -> {(provider name, model_name): Model}
+        self._by_provider: dict[str, dict[tuple[str, TaskType], Model]] = {}
+        self._by_task: dict[TaskType, dict[tuple[str, str], Model]] = {}
         self._load_providers(config or {})
 
-    def _load_providers(self, config: Dict[str, Dict[str, Any]]) -> None:
+    def _load_providers(self, config: dict[str, dict[str, Any]]) -> None:
         """Load available providers using the ProviderFactory.
         
         This method attempts to load all supported providers and their models,
         skipping those that are not installed or cannot be initialized.
+
+        Creating a provider may import its SDK and set up an HTTP client, so
+        providers are created concurrently on a thread pool. Their models are
+        then registered serially, in sorted provider name order. A provider
+        is only added once all of its models were listed successfully.
         
         Args:
             config: Configuration dictionary for providers
         """
-        for provider_name in ProviderFactory.get_supported_providers():
+        provider_names = sorted(ProviderFactory.get_supported_providers())
+
+        def create(provider_name: str) -> Optional[Provider]:
             try:
-                provider_config = config.get(provider_name, {})
-                provider = ProviderFactory.create_provider(provider_name, provider_config)
+                return ProviderFactory.create_provider(provider_name, config.get(provider_name, {}))
+            except ImportError:
+                # Skip providers that aren't installed
+                return None
+            except Exception:
+                # Skip providers that fail to initialize
+                return None
 
-                self._providers[provider.name] = provider
+        if len(provider_names) <= 1:
+            providers = [create(provider_name) for provider_name in provider_names]
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_PROVIDER_WORKERS, len(provider_names))) as executor:
+                providers = list(executor.map(create, provider_names))
 
+        for provider in providers:
+            if provider is None:
+                continue
+            try:
                 # Auto-register all models from this provider
                 self._register_provider_models(provider)
-            except ImportError:
-                # Skip providers that aren't installed
-                continue
-            except Exception as e:
-                # Log other provider loading errors
+            except Exception:
+                # Skip providers whose models cannot be listed
                 continue
+            self._providers[provider.name] = provider
 
     def _register_provider_models(self, provider: Provider) -> None:
         """Register all available models from a provider.
         
+        The models are listed in full before any index is updated, so a
+        provider that fails part-way leaves the registry untouched. When
+        several models share a name, ``get_model`` resolves it to the first one
+        registered, the same rule providers follow in their own ``get_model``.
+        The provider and task indexes key models by provider, name and task,
+        so the filtered queries still return every provider's models.
+
         Args:
             provider: Provider instance to register models from
         """
-        for model in provider.get_models():
-            self._models[model.model_name] = model
+        models = list(provider_iter_models(provider))
+        for model in models:
+            task = model.capability.supported_task
+            self._models.setdefault(model.model_name, model)
+            self._by_provider.setdefault(provider.name, {}).setdefault((model.model_name, task), model)
+            self._by_task.setdefault(task, {}).setdefault((provider.name, model.model_name), model)
 
-    def get_available_providers(self) -> Set[str]:
+    def get_available_providers(self) -> set[str]:
         """Get the set of currently loaded providers.
         
         Returns:
-            Set[str]: Names of loaded providers
+            set[str]: Names of loaded providers
             
         Example:
             ```python
@@ -93,8 +133,50 @@ class ModelRegistry:
 
 
 
+    def get_model(self, model_name: str) -> Optional[Model]:
+        """Get a registered model by name.
+
+        Args:
+            model_name: Name of the model, e.g. "gpt-4"
+
+        Returns:
+            Optional[Model]: The first model registered under ``model_name``,
+                or None if no provider registered it
+        """
+        return self._models.get(model_name)
+
+    def list_models(self,
+                    provider: Optional[str] = None,
+                    task: Optional[TaskType] = None) -> list[Model]:
+        """List registered models, optionally filtered by provider and task.
+
+        Filters are answered from inverted indexes built at registration time,
+        so the cost is proportional to the number of matches rather than the
+        number of registered models.
+
+        Args:
+            provider: Optional provider name the model must belong to
+            task: Optional TaskType the model must support
+
+        Returns:
+            list[Model]: Matching models in registration order
+        """
+        if provider is None and task is None:
+            return [model for models in self._by_provider.values() for model in models.values()]
+        if task is None:
+            return list(self._by_provider.get(provider, {}).values())
+
+        by_task = self._by_task.get(task, {})
+        if provider is None:
+            return list(by_task.values())
+
+        by_provider = self._by_provider.get(provider, {})
+        if len(by_provider) <= len(by_task):
+            return [model for (_, model_task), model in by_provider.items() if model_task == task]
+        return [model for (provider_name, _), model in by_task.items() if provider_name == provider]
+
     def find_models(self, 
-                   task: TaskType) -> List[Model]:
+                   task: TaskType) -> list[Model]:
         """Find models that support the specified task and modality requirements.
         
         Args:
@@ -102,32 +184,18 @@ class ModelRegistry:
             modality: Required Modality the model must support
             
         Returns:
-            List[Model]: List of models meeting the requirements
+            list[Model]: Every provider's models meeting the requirements, read
+                from the task index built at registration time
         """
-        matching_models = []
-        
-        # Get relevant providers
+        return list(self._by_task.get(task, {}).values())
 
-        
-        # Check each provider's models
-        for provider_instance in self._providers.values():
-            for model in provider_instance.get_models():                
-                if model.supports_task(task):
-                    matching_models.append(model)
-                    
-        return matching_models
-
-    def get_supported_tasks(self) -> Set[TaskType]:
+    def get_supported_tasks(self) -> set[TaskType]:
         """Get all supported tasks across available models.
         
         Args:
             modality: Optional modality to filter tasks by
             
         Returns:
-            Set[TaskType]: Set of supported tasks
+            set[TaskType]: Set of supported tasks
         """
-        tasks = set()
-        for provider in self._providers.values():
-            for model in provider.get_models():
-                tasks.update(model.supported_task)
-        return tasks
\ No newline at end of file
+        return set(self._by_task)
\ No newline at end of file
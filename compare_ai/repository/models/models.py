@@ -1,12 +1,14 @@
+from __future__ import annotations
+import json
 from dataclasses import dataclass
-from typing import Dict, Set, Optional, List, Any, Union
+from typing import Any, AsyncIterator, Union
 from .definitions import TaskType
-from .provider import Provider
+from .provider import Provider, provider_apredict, provider_astream_predict
 
-@dataclass
+@dataclass(slots=True)
 class ModelCapability:
     supported_task: TaskType
-    supported_formats: List[str]
+    supported_formats: list[str]
 
 
     def supports_task(self, task: TaskType) -> bool:
@@ -20,31 +22,33 @@ class ModelCapability:
         """
         return task == self.supported_task 
 
-    def get_supported_formats(self) -> List[str]:
+    def get_supported_formats(self) -> list[str]:
         """Get supported formats for a specific modality.
 
         Args:
             modality: Modality to get formats for
 
         Returns:
-            List[str]: List of supported format strings
+            list[str]: List of supported format strings
         """
         return self.get("supported_formats", [])
 
 
 class Model:
+    __slots__ = ("_model_name", "_provider", "_capability", "_supported_tasks", "_task_value")
+
     def __init__(
         self,
         model_name: str,
         provider: Provider,
         capability: ModelCapability,
     ):
-        if not isinstance(provider, Provider):
-            raise TypeError(f"provider must be an instance of Provider, got {type(provider)}")
-        
         self._model_name = model_name
         self._provider = provider
         self._capability = capability
+        self._supported_tasks = frozenset((capability.supported_task,))
+        # Serialized task value, precomputed so to_dict is a plain dict literal
+        self._task_value = capability.supported_task.value
 
   
     @property
@@ -58,8 +62,8 @@ class Model:
    
 
     @property
-    def supported_task(self) -> TaskType:
-        return {self._capability.supported_task}
+    def supported_task(self) -> frozenset[TaskType]:
+        return self._supported_tasks
     
 
     @property
@@ -70,21 +74,30 @@ class Model:
         return task == self._capability.supported_task
 
 
-    def get_supported_formats(self) -> List[str]:
+    def get_supported_formats(self) -> list[str]:
         return self._capability.supported_formats
 
-    def to_dict(self) -> Dict:
+    def to_dict(self) -> dict:
+        """Serialize the model to a JSON-ready dictionary.
+
+        The provider is represented by its name so the result can be passed
+        straight to ``json.dumps``.
+        """
         return {
             "model_name": self._model_name,
-            "provider": self._provider,
+            "provider": self._provider.name,
             "capability": {
-                "supported_task": self._capability.supported_task.value,
+                "supported_task": self._task_value,
                 "supported_formats": self._capability.supported_formats
             }
         }
 
+    def to_json(self) -> str:
+        """Serialize the model to a JSON string."""
+        return json.dumps(self.to_dict())
+
     def predict(self, 
-               input_data: Union[str, Dict[str, Any], List[Union[str, Dict[str, Any]]]]) -> Union[Any, List[Any]]:
+               input_data: Union[str, dict[str, Any], list[Union[str, dict[str, Any]]]]) -> Union[Any, list[Any]]:
         """Execute prediction using the model. Always uses batch processing internally.
         
         Args:
@@ -92,7 +105,7 @@ class Model:
             task: Optional TaskType to specify which task to perform
             
         Returns:
-            Union[Any, List[Any]]: Single result or list of results depending on input
+            Union[Any, list[Any]]: Single result or list of results depending on input
             
         Raises:
             ValueError: If inputs are invalid or task is not supported
@@ -107,4 +120,36 @@ class Model:
         results = self._provider.predict(self.model_name, inputs, task)
         
         # Return single result if single input was provided
-        return results[0] if is_single_input else results
\ No newline at end of file
+        return results[0] if is_single_input else results
+
+    async def apredict(self,
+                       input_data: Union[str, dict[str, Any], list[Union[str, dict[str, Any]]]]) -> Union[Any, list[Any]]:
+        """Coroutine counterpart of ``predict`` for callers with a running event loop.
+
+        Args:
+            input_data: Single input or list of inputs for prediction
+
+        Returns:
+            Union[Any, list[Any]]: Single result or list of results depending on input
+        """
+        is_single_input = not isinstance(input_data, list)
+        inputs = [input_data] if is_single_input else input_data
+
+        results = await provider_apredict(self._provider, self.model_name, inputs, self._capability.supported_task)
+
+        return results[0] if is_single_input else results
+
+    async def astream_predict(self, input_data: Union[str, dict[str, Any]]) -> AsyncIterator[Any]:
+        """Stream the prediction for a single input as the provider produces it.
+
+        Args:
+            input_data: Single input for prediction
+
+        Yields:
+            Successive pieces of the output; providers that cannot stream
+            yield the whole result once
+        """
+        async for chunk in provider_astream_predict(
+            self._provider, self.model_name, input_data, self._capability.supported_task
+        ):
+            yield chunk
@@ -1,18 +1,62 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from __future__ import annotations
+import asyncio
+from typing import AsyncIterator, Iterator, Optional, Protocol, Any
 from .definitions import TaskType
 
-class Provider(ABC):
-    @abstractmethod
+class Provider(Protocol):
+    """Structural interface every model provider implements.
+
+    Providers do not need to inherit from this class. Only ``name``,
+    ``get_models`` and ``predict`` are required; ``iter_models``,
+    ``apredict`` and ``astream_predict`` are optional, and callers reach them
+    through ``provider_iter_models``, ``provider_apredict`` and
+    ``provider_astream_predict``, which fall back to ``get_models`` and a
+    threaded ``predict`` when a provider lacks them.
+
+    The protocol only declares signatures. Providers that want the shared
+    ``__init__`` inherit from ``BaseProvider`` instead.
+    """
+    api_key: Optional[str]
+    name: str
+
+    def get_models(self, model_name: Optional[str] = None) -> list[Any]:
+        ...
+
+    def predict(self, model_name: str, inputs: list[str], task: TaskType) -> list[str]:
+        ...
+
+
+class BaseProvider:
+    """Plain base class for providers that want the shared ``__init__``."""
+
     def __init__(self, api_key: str = None, **kwargs):
         self.api_key = api_key
         self.kwargs = kwargs
         self.name: str = ""
 
-    @abstractmethod
-    def get_models(self, model_name: Optional[str] = None) -> List[any]:
-        pass
 
-    @abstractmethod
-    def predict(self, model_name: str, inputs: List[str], task: TaskType) -> List[str]:
-        pass
\ No newline at end of file
+def provider_iter_models(provider: Provider) -> Iterator[Any]:
+    """Iterate a provider's models, using ``get_models`` if it has no ``iter_models``."""
+    iter_models = getattr(provider, "iter_models", None)
+    if iter_models is None:
+        return iter(provider.get_models())
+    return iter_models()
+
+
+async def provider_apredict(provider: Provider, model_name: str, inputs: list[Any], task: TaskType) -> list[Any]:
+    """Await a provider's ``apredict``, or run its ``predict`` in a worker thread if it has none."""
+    apredict = getattr(provider, "apredict", None)
+    if apredict is None:
+        return await asyncio.to_thread(provider.predict, model_name, inputs, task)
+    return await apredict(model_name, inputs, task)
+
+
+async def provider_astream_predict(provider: Provider, model_name: str, input_data: Any, task: TaskType) -> AsyncIterator[Any]:
+    """Iterate a provider's ``astream_predict``, or yield its whole prediction if it has none."""
+    astream_predict = getattr(provider, "astream_predict", None)
+    if astream_predict is None:
+        results = await provider_apredict(provider, model_name, [input_data], task)
+        yield results[0]
+        return
+    async for chunk in astream_predict(model_name, input_data, task):
+        yield chunk
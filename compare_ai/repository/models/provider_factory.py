@@ -1,25 +1,29 @@
-from pathlib import Path
+from __future__ import annotations
 import importlib
+import importlib.util
 import functools
-from typing import Dict, Set, Any, Optional
+from typing import Any, Optional
 
-from abc import ABC, abstractmethod
-from typing import Optional, Dict, List, Any, Union
-from .models import Model, ModelCapability
-from .definitions import TaskType
 from .provider import Provider
 
 
+# Provider key -> (module path, class name, required package) of its implementation
+_PROVIDER_REGISTRY: dict[str, tuple[str, str, str]] = {
+    "openai": ("compare_ai.repository.models.providers.openai_provider", "OpenaiProvider", "openai"),
+}
+
+
 class ProviderFactory:
     """Factory class for dynamically loading and creating AI model providers.
     
-    This factory handles the dynamic loading of provider implementations based on a 
-    consistent naming convention. It supports lazy loading of providers and their
-    dependencies, making it easy to add new providers without modifying existing code.
+    This factory handles the dynamic loading of provider implementations listed in
+    ``_PROVIDER_REGISTRY``. Provider modules are only imported when a provider is
+    created, so their optional dependencies are loaded lazily.
     
-    Naming Convention:
-        - Module files should be named: {provider_name}_provider.py
-        - Classes should be named: {ProviderName}Provider
+    Adding a Provider:
+        - Implement it in providers/{provider_name}_provider.py
+        - Register it in ``_PROVIDER_REGISTRY`` as
+          "{provider_name}": (module path, class name, required package)
         
     Example:
         ```python
@@ -35,14 +39,12 @@ class ProviderFactory:
         ```
     """
 
-    PROVIDERS_DIR = Path(__file__).parent / "providers"
-
     @classmethod
-    def create_provider(cls, provider_key: str, config: Optional[Dict[str, Any]] = None) -> Provider:
+    def create_provider(cls, provider_key: str, config: Optional[dict[str, Any]] = None) -> Provider:
         """Dynamically load and create an instance of a provider.
         
         This method handles the dynamic import and instantiation of provider classes
-        based on the provider_key. It follows a consistent naming convention and
+        based on the provider_key, as listed in the provider registry, and
         handles dependency management.
         
         Args:
@@ -66,15 +68,13 @@ class ProviderFactory:
             provider = ProviderFactory.create_provider("openai", config)
             ```
         """
-        if provider_key not in cls.get_supported_providers():
+        if provider_key not in _PROVIDER_REGISTRY:
             raise ValueError(
                 f"Provider '{provider_key}' is not supported. "
                 f"Supported providers: {cls.get_supported_providers()}"
             )
 
-        provider_class_name = f"{provider_key.capitalize()}Provider"
-        provider_module_name = f"{provider_key}_provider"
-        module_path = f"compare_ai.repository.models.providers.{provider_module_name}"
+        module_path, provider_class_name, _ = _PROVIDER_REGISTRY[provider_key]
 
         try:
             module = importlib.import_module(module_path)
@@ -90,14 +90,14 @@ class ProviderFactory:
 
     @classmethod
     @functools.cache
-    def get_supported_providers(cls) -> Set[str]:
+    def get_supported_providers(cls) -> set[str]:
         """Get the set of supported provider names.
         
-        This method scans the providers directory to find all available provider
-        implementations. The results are cached for performance.
+        Providers are listed in a static registry, so no filesystem scan or
+        import is needed. The results are cached for performance.
         
         Returns:
-            Set[str]: Set of provider names (e.g., {'openai', 'anthropic'})
+            set[str]: Set of provider names (e.g., {'openai', 'anthropic'})
             
         Example:
             ```python
@@ -105,17 +105,15 @@ class ProviderFactory:
             print(f"Available providers: {providers}")
             ```
         """
-        provider_files = cls.PROVIDERS_DIR.glob("*_provider.py")
-        return {
-            file.stem.replace("_provider", "") 
-            for file in provider_files 
-            if not file.stem.startswith("_")
-        }
+        return set(_PROVIDER_REGISTRY)
 
     @classmethod
     def is_provider_available(cls, provider_key: str) -> bool:
         """Check if a specific provider is available and its dependencies are installed.
         
+        Only the import machinery's finders are consulted: neither the provider
+        module nor its SDK is imported, and no provider instance is created.
+        
         Args:
             provider_key: String identifier for the provider
             
@@ -128,8 +126,8 @@ class ProviderFactory:
                 provider = ProviderFactory.create_provider("openai")
             ```
         """
-        try:
-            cls.create_provider(provider_key)
-            return True
-        except (ImportError, ValueError):
-            return False 
\ No newline at end of file
+        if provider_key not in _PROVIDER_REGISTRY:
+            return False
+
+        module_path, _, package = _PROVIDER_REGISTRY[provider_key]
+        return all(importlib.util.find_spec(name) is not None for name in (package, module_path))
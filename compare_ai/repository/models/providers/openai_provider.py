@@ -1,98 +1,505 @@
-from typing import Optional, List, Any, Dict
-from ..models import Model, ModelCapability, TaskType
-import openai
-from ..provider_factory import Provider
+from typing import TYPE_CHECKING, Optional, Iterator, AsyncIterator, List, Any, Dict, Tuple
+from ..models import Model, ModelCapability
+from ..definitions import TaskType
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
 
-class OpenaiProvider(Provider):
+if TYPE_CHECKING:
+    # Only for annotations; the SDK itself is imported when a provider is created
+    import openai
+
+# Default upper bound on chat completion requests in flight for a single predict call.
+MAX_CONCURRENT_REQUESTS = 10
+
+# Default number of times the SDK retries a request after a rate limit,
+# timeout, connection error or 5xx response, with exponential backoff
+MAX_RETRIES = 5
+
+# Polling interval bounds, in seconds, while waiting on a Batch API job
+BATCH_POLL_INTERVAL = 5.0
+BATCH_POLL_MAX_INTERVAL = 60.0
+
+# Batch API job states after which polling stops
+_BATCH_TERMINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Supported input formats per task
+_FORMAT_MAP: Dict[TaskType, Tuple[str, ...]] = {
+    TaskType.TEXT_GENERATION: ("txt", "md", "json"),
+}
+_EMPTY: Tuple[str, ...] = ()
+
+# Static catalog of available models and the tasks each supports
+_MODELS_CATALOG: Tuple[Dict[str, Any], ...] = (
+    {"model_name": "gpt-4", "task_support": (TaskType.TEXT_GENERATION,)},
+    {"model_name": "gpt-4-vision-preview", "task_support": (TaskType.TEXT_GENERATION,)},
+    {"model_name": "gpt-3.5-turbo", "task_support": (TaskType.TEXT_GENERATION,)},
+)
+
+# Sync clients shared by every provider using the same API key and retry
+# policy, so their connection pools and TLS sessions are reused across instances
+_CLIENTS: Dict[Tuple[Optional[str], int], "openai.OpenAI"] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+def _shared_client(sdk, api_key: Optional[str], max_retries: int) -> "openai.OpenAI":
+    """Return the process-wide ``openai.OpenAI`` client for ``api_key`` and ``max_retries``."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get((api_key, max_retries))
+        if client is None:
+            client = _CLIENTS[api_key, max_retries] = sdk.OpenAI(api_key=api_key, max_retries=max_retries)
+        return client
+
+def _messages_key(messages: Any) -> Optional[str]:
+    """Canonical JSON encoding of a request payload, or None if it cannot be encoded."""
+    try:
+        return json.dumps(messages, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+def _dedupe_inputs(inputs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """Collapse inputs with identical messages so each is requested once.
+
+    The unique inputs are also grouped by prompt cache key, so requests that
+    share a prompt prefix are dispatched back to back and reach the server's
+    prefix cache while it is warm.
+
+    Inputs whose messages cannot be JSON encoded, e.g. because they hold SDK
+    message objects, are always treated as unique.
+
+    Returns:
+        The unique inputs, grouped by prefix in first-seen order, and for
+        every original input the index of its unique counterpart
+    """
+    groups: Dict[Optional[str], List[Dict[str, Any]]] = {}
+    slot_by_key: Dict[str, Tuple[Optional[str], int]] = {}
+    slots = []
+    for input_data in inputs:
+        key = _messages_key(input_data.get("messages", []))
+        slot = slot_by_key.get(key) if key is not None else None
+        if slot is None:
+            prefix = _prompt_cache_key(input_data)
+            group = groups.setdefault(prefix, [])
+            slot = (prefix, len(group))
+            group.append(input_data)
+            if key is not None:
+                slot_by_key[key] = slot
+        slots.append(slot)
+
+    unique_inputs = []
+    offsets = {}
+    for prefix, group in groups.items():
+        offsets[prefix] = len(unique_inputs)
+        unique_inputs.extend(group)
+    return unique_inputs, [offsets[prefix] + index for prefix, index in slots]
+
+def _prompt_cache_key(input_data: Dict[str, Any]) -> Optional[str]:
+    """Key that routes requests sharing a prompt prefix to OpenAI's prompt cache.
+
+    An explicit ``prompt_cache_key`` in the input wins; otherwise requests
+    that open with a system message are keyed by that message's content.
+    Content given as a list of parts is keyed by its JSON encoding, and
+    content that cannot be encoded gets no key.
+    """
+    key = input_data.get("prompt_cache_key")
+    if key is not None:
+        return key
+    messages = input_data.get("messages", [])
+    if not messages or not isinstance(messages[0], dict) or messages[0].get("role") != "system":
+        return None
+    content = messages[0].get("content")
+    if not isinstance(content, str):
+        try:
+            content = json.dumps(content, sort_keys=True)
+        except TypeError:
+            return None
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+def _request_options(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extra keyword arguments for a chat completion request."""
+    key = _prompt_cache_key(input_data)
+    # Sent through extra_body so SDK versions predating the named argument work too
+    return {"extra_body": {"prompt_cache_key": key}} if key is not None else {}
+
+class OpenaiProvider:
     """Provider implementation for OpenAI models.
     
     This provider manages metadata and inference for OpenAI models including GPT-4, GPT-3.5, and their variants.
+    It satisfies the Provider protocol structurally rather than by inheritance.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize OpenAI provider with API credentials."""
-        super().__init__()
-        self.client = openai.OpenAI(api_key=api_key)
+    def __init__(self, api_key: Optional[str] = None, max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+                 cache_dir: Optional[str] = None, max_retries: int = MAX_RETRIES):
+        """Initialize OpenAI provider with API credentials.
+
+        Providers with the same API key share one sync client. Async clients
+        are created per provider and per event loop, since httpx ties pooled
+        connections to the loop that opened them.
+
+        Rate-limited, timed-out and failed (5xx) requests are retried up to
+        ``max_retries`` times with exponential backoff, honouring any
+        ``Retry-After`` the API sends, so one transient error does not abort
+        a whole batch.
+
+        When ``cache_dir`` is set, chat completions are cached there keyed by
+        model and messages, and identical requests are answered from disk.
+
+        The ``openai`` SDK is imported here rather than at module level so that
+        loading this module does not pay the SDK's import cost until a provider
+        is actually created.
+
+        Raises:
+            ImportError: If the ``openai`` package is not installed
+        """
+        try:
+            import openai
+        except ImportError as e:
+            raise ImportError(
+                "The openai package is required for the OpenAI provider. "
+                "Please install it with: poetry install --extras openai"
+            ) from e
+
+        self._openai = openai
+        self.max_retries = max_retries
+        self.client: "openai.OpenAI" = _shared_client(openai, api_key, max_retries)
+        # Event loop -> its AsyncOpenAI client; entries go away with their loop
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, openai.AsyncOpenAI]" = (
+            weakref.WeakKeyDictionary()
+        )
         self.api_key = api_key
+        self.max_concurrency = max_concurrency
+        self.cache_dir = cache_dir
         self.name = "openai"
+        self._models: Optional[List[Model]] = None
+        self._by_name: Optional[Dict[str, Model]] = None
+
+    @property
+    def async_client(self) -> "openai.AsyncOpenAI":
+        """The ``openai.AsyncOpenAI`` client for the running event loop.
+
+        A client is created on first use in each loop, so connections kept
+        alive by one ``asyncio.run`` are never reused after that loop closes.
+        Its connection pool is sized to ``max_concurrency`` so every request
+        the semaphore admits gets a kept-alive connection instead of queueing
+        for one of httpx's defaults.
+
+        Raises:
+            RuntimeError: If accessed outside a running event loop
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            import httpx
+
+            limits = httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            )
+            client = self._async_clients[loop] = self._openai.AsyncOpenAI(
+                api_key=self.api_key,
+                max_retries=self.max_retries,
+                http_client=self._openai.DefaultAsyncHttpxClient(limits=limits),
+            )
+        return client
+
+    async def aclose(self) -> None:
+        """Close the running loop's async client and its pool, if one was created."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
 
     def get_models(self) -> List[Model]:
         """Get all models available for this provider.
         
+        The catalog is static, so the models are built on the first call and
+        the same list is returned afterwards.
 
         Returns:
             List of Model instances with their capabilities
         """
-        # Get base capabilities for the model
+        if self._models is None:
+            self._models = list(self.iter_models())
+        return self._models
 
-        models = []
-        models_array = self._list_available_models()
+    def iter_models(self) -> Iterator[Model]:
+        """Yield the provider's models, one per (model, task) pair.
 
-        for model in models_array:
+        Models are yielded as they are built, and the full list is kept once
+        the iteration completes so later calls reuse the same instances.
+        """
+        if self._models is not None:
+            yield from self._models
+            return
+
+        models = []
+        for model in self._list_available_models():
             for task in model["task_support"]:
-                capability = ModelCapability(
-                    supported_task=task,
-                    supported_formats=self._get_supported_formats(task),
+                instance = Model(
+                    model_name=model["model_name"],
+                    provider=self,
+                    capability=ModelCapability(
+                        supported_task=task,
+                        supported_formats=list(self._get_supported_formats(task)),
+                    )
                 )
-                
-            models.append(Model(
-                model_name=model["model_name"],
-                provider=self,
-                capability=capability
-            ))
-        
-        return models
+                models.append(instance)
+                yield instance
+
+        self._models = models
+
+    def get_model(self, model_name: str) -> Optional[Model]:
+        """Look up a model by name.
 
-    def _list_available_models(self) -> List[str]:
+        Returns:
+            The first Model registered under ``model_name``, or None
+        """
+        if self._by_name is None:
+            by_name = {}
+            for model in self.get_models():
+                by_name.setdefault(model.model_name, model)
+            self._by_name = by_name
+        return self._by_name.get(model_name)
+
+    def _list_available_models(self) -> Tuple[Dict[str, Any], ...]:
         """List available OpenAI models."""
-        return [
-            {
-                "model_name": "gpt-4",
-                "task_support": [TaskType.TEXT_GENERATION],
-            },
-            {
-                "model_name": "gpt-4-vision-preview",
-                "task_support": [TaskType.TEXT_GENERATION]
-            },
-            {
-                "model_name": "gpt-3.5-turbo",
-                "task_support": [TaskType.TEXT_GENERATION],
-            }
-        ]
-
-    def predict(self, model_name: str, inputs: List[Dict[str, Any]], task: TaskType) -> List[Any]:
+        return _MODELS_CATALOG
+
+    def predict(self, model_name: str, inputs: List[Dict[str, Any]], task: TaskType,
+                batch_mode: bool = False) -> List[Any]:
         """Execute prediction using OpenAI models.
         
         Args:
             model_name: Name of the OpenAI model
             inputs: List of input dictionaries
             task: TaskType to perform
+            batch_mode: Submit the inputs as a single OpenAI Batch API job
+                instead of one request each. Batch jobs are cheaper but may
+                take up to 24 hours, so this suits offline evaluations only.
             
         Returns:
             List of model outputs
         """
         if task == TaskType.TEXT_GENERATION:
-            return self._predict_text(model_name, inputs)
+            unique_inputs, positions = _dedupe_inputs(inputs)
+            if batch_mode:
+                results = self._predict_text_batch_api(model_name, unique_inputs)
+            else:
+                results = self._predict_text(model_name, unique_inputs)
+            return [results[position] for position in positions]
+
+    async def apredict(self, model_name: str, inputs: List[Dict[str, Any]], task: TaskType) -> List[Any]:
+        """Execute prediction using OpenAI models from a running event loop.
+
+        Args:
+            model_name: Name of the OpenAI model
+            inputs: List of input dictionaries
+            task: TaskType to perform
+
+        Returns:
+            List of model outputs
+        """
+        if task == TaskType.TEXT_GENERATION:
+            unique_inputs, positions = _dedupe_inputs(inputs)
+            results = await self._predict_text_async(model_name, unique_inputs)
+            return [results[position] for position in positions]
+
+    async def astream_predict(self, model_name: str, input_data: Dict[str, Any], task: TaskType) -> AsyncIterator[str]:
+        """Stream a text generation for a single input as it is decoded.
+
+        Content deltas are yielded as soon as the API sends them, so callers
+        rendering output live do not wait for the full completion. The joined
+        text is stored in the response cache once the stream ends, and a
+        cached response is yielded whole.
+
+        Args:
+            model_name: Name of the OpenAI model
+            input_data: Input dictionary with the chat ``messages``
+            task: TaskType to perform
+
+        Yields:
+            Successive pieces of the generated text
+
+        Raises:
+            ValueError: If ``task`` cannot be streamed
+        """
+        if task != TaskType.TEXT_GENERATION:
+            raise ValueError(f"Streaming is not supported for task {task}")
+
+        messages = input_data.get("messages", [])
+        cache_path = self._response_cache_path(model_name, messages)
+        content = self._read_cached_response(cache_path)
+        if content is not None:
+            yield content
+            return
+
+        stream = await self.async_client.chat.completions.create(
+            model=model_name,
+            messages=messages,
+            stream=True,
+            **_request_options(input_data)
+        )
+        chunks = []
+        async for event in stream:
+            if event.choices and event.choices[0].delta.content:
+                chunk = event.choices[0].delta.content
+                chunks.append(chunk)
+                yield chunk
+        self._write_cached_response(cache_path, "".join(chunks))
  
 
     def _predict_text(self, model_name: str, inputs: List[Dict[str, Any]]) -> List[str]:
-        """Handle text generation predictions."""
-        responses = []
-        for input_data in inputs:
-            # Update this section to handle the messages format
+        """Handle text generation predictions.
+
+        Each input is an independent network round-trip, so requests are
+        issued concurrently (up to ``max_concurrency`` at a time) and the
+        responses are returned in input order.
+        """
+        # Resolve the bound method once instead of three attribute lookups per input
+        create = self.client.chat.completions.create
+
+        def predict_one(input_data: Dict[str, Any]) -> str:
             messages = input_data.get("messages", [])
-            response = self.client.chat.completions.create(
-                model=model_name,
-                messages=messages  # Use the messages directly instead of creating new message
-            )
-            responses.append(response.choices[0].message.content)
-        return responses
+            cache_path = self._response_cache_path(model_name, messages)
+            content = self._read_cached_response(cache_path)
+            if content is None:
+                response = create(
+                    model=model_name,
+                    messages=messages,
+                    **_request_options(input_data)
+                )
+                content = response.choices[0].message.content
+                self._write_cached_response(cache_path, content)
+            return content
+
+        if len(inputs) <= 1:
+            return [predict_one(input_data) for input_data in inputs]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(inputs))) as executor:
+            return list(executor.map(predict_one, inputs))
+
+    async def _predict_text_async(self, model_name: str, inputs: List[Dict[str, Any]]) -> List[str]:
+        """Handle text generation predictions with the async client.
+
+        All requests are dispatched on the event loop at once, with a
+        semaphore keeping at most ``max_concurrency`` of them in flight.
+        Responses are returned in input order.
+        """
+        create = self.async_client.chat.completions.create
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def predict_one(input_data: Dict[str, Any]) -> str:
+            messages = input_data.get("messages", [])
+            cache_path = self._response_cache_path(model_name, messages)
+            content = self._read_cached_response(cache_path)
+            if content is None:
+                async with semaphore:
+                    response = await create(
+                        model=model_name,
+                        messages=messages,
+                        **_request_options(input_data)
+                    )
+                content = response.choices[0].message.content
+                self._write_cached_response(cache_path, content)
+            return content
+
+        return list(await asyncio.gather(*(predict_one(input_data) for input_data in inputs)))
+
+
+    def _predict_text_batch_api(self, model_name: str, inputs: List[Dict[str, Any]]) -> List[str]:
+        """Handle text generation predictions through the OpenAI Batch API.
+
+        The inputs are uploaded as one JSONL file, the job is polled with
+        exponential backoff until it finishes, and the responses are matched
+        back to the inputs by ``custom_id``.
+
+        Raises:
+            RuntimeError: If the job does not complete or some inputs have no response
+        """
+        if not inputs:
+            return []
+
+        requests = "\n".join(
+            json.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model_name,
+                    "messages": input_data.get("messages", []),
+                    **_request_options(input_data).get("extra_body", {}),
+                },
+            })
+            for index, input_data in enumerate(inputs)
+        )
+        input_file = self.client.files.create(
+            file=("batch.jsonl", requests.encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        delay = BATCH_POLL_INTERVAL
+        while batch.status not in _BATCH_TERMINAL_STATES:
+            time.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX_INTERVAL)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'")
+
+        results: List[Optional[str]] = [None] * len(inputs)
+        output = self.client.files.content(batch.output_file_id).text if batch.output_file_id else ""
+        for line in output.splitlines():
+            if not line:
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                results[int(record["custom_id"])] = response["body"]["choices"][0]["message"]["content"]
+
+        missing = results.count(None)
+        if missing:
+            raise RuntimeError(f"Batch {batch.id} returned no response for {missing} of {len(inputs)} inputs")
+        return results
+
+    def _response_cache_path(self, model_name: str, messages: List[Dict[str, Any]]) -> Optional[str]:
+        """Return the cache file for a request, or None when caching is disabled.
+
+        Requests whose messages cannot be JSON encoded are not cached.
+        """
+        if self.cache_dir is None:
+            return None
+        payload = _messages_key([model_name, messages])
+        if payload is None:
+            return None
+        key = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_cached_response(self, cache_path: Optional[str]) -> Optional[str]:
+        """Return the cached completion stored at ``cache_path``, if any."""
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        with open(cache_path, "r", encoding="utf-8") as file:
+            return json.load(file)
 
+    def _write_cached_response(self, cache_path: Optional[str], content: str) -> None:
+        """Store a completion at ``cache_path``, replacing the file atomically."""
+        if cache_path is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(content, file)
+        os.replace(tmp_path, cache_path)
 
-    def _get_supported_formats(self, task: TaskType) -> List[str]:
+    def _get_supported_formats(self, task: TaskType) -> Tuple[str, ...]:
         """Get supported formats for task."""
-        format_map = {
-            TaskType.TEXT_GENERATION: ["txt", "md", "json"]
-        }
-        return format_map.get(task, [])
+        return _FORMAT_MAP.get(task, _EMPTY)
 
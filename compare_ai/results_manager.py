@@ -9,10 +9,38 @@ class Result:
     
 
     def save_to_file(self, file_path):
-        with open(file_path, 'w') as file:
-            json.dump(self.predictions, file)
+        # json.dumps encodes the whole payload in one C call; json.dump streams
+        # it through the pure-Python iterencode and many small writes
+        payload = json.dumps(self.predictions, separators=(",", ":"))
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write(payload)
 
     def load_from_file(self, file_path):
-        with open(file_path, 'r') as file:
-            self.predictions = json.load(file)
- 
\ No newline at end of file
+        with open(file_path, 'r', encoding='utf-8') as file:
+            self.predictions = json.loads(file.read())
+
+    @staticmethod
+    def append(prediction, file_path):
+        """Append a single prediction to a JSON Lines file.
+
+        Each prediction is written and flushed as its own line, so a run can
+        be persisted as it progresses without holding every result in memory.
+        """
+        line = json.dumps(prediction, separators=(",", ":")) + "\n"
+        with open(file_path, 'a', encoding='utf-8') as file:
+            file.write(line)
+            file.flush()
+
+    @staticmethod
+    def iter_from_file(file_path):
+        """Yield the predictions stored in a JSON Lines file one at a time.
+
+        Raises:
+            ValueError: If the last line is incomplete, e.g. because a writer
+                was interrupted mid-append
+        """
+        with open(file_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if not line.endswith("\n"):
+                    raise ValueError(f"Truncated prediction record at the end of {file_path}")
+                yield json.loads(line)
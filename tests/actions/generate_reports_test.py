@@ -0,0 +1,163 @@
+import gc
+import pytest
+from unittest.mock import patch
+from matplotlib.figure import Figure
+from compare_ai.actions.generate_reports import (
+    validate_data_format, clear_validation_cache, generate_report, generate_metric_plot,
+    _fingerprint
+)
+
+
+@pytest.fixture
+def data():
+    return [
+        {
+            "name": "Accuracy",
+            "type": "numerical",
+            "models": {"gpt-4": 0.9, "gpt-3.5-turbo": 0.7}
+        },
+        {
+            "name": "Correctness",
+            "type": "categorical",
+            "models": {
+                "gpt-4": {"accurate": 8, "inaccurate": 2},
+                "gpt-3.5-turbo": {"accurate": 5, "inaccurate": 5}
+            }
+        }
+    ]
+
+
+class TestValidateDataFormat:
+    def test_valid_data(self, data):
+        """Test that well-formed data passes validation"""
+        assert validate_data_format(data) is True
+
+    def test_data_must_be_list(self):
+        """Test that non-list data is rejected"""
+        with pytest.raises(ValueError, match="Data must be a list"):
+            validate_data_format({"name": "Accuracy"})
+
+    def test_invalid_type(self, data):
+        """Test that unknown metric types are rejected"""
+        data[0]["type"] = "ordinal"
+        with pytest.raises(ValueError, match="either 'categorical' or 'numerical'"):
+            validate_data_format(data)
+
+    def test_missing_models(self, data):
+        """Test that items without a models dictionary are rejected"""
+        del data[0]["models"]
+        with pytest.raises(ValueError, match="'models' key"):
+            validate_data_format(data)
+
+    def test_numerical_value_type(self, data):
+        """Test that numerical metrics require numeric values"""
+        data[0]["models"]["gpt-4"] = "high"
+        with pytest.raises(ValueError, match="values must be int or float"):
+            validate_data_format(data)
+
+    def test_categorical_value_type(self, data):
+        """Test that categorical metrics require numeric label counts"""
+        data[1]["models"]["gpt-4"]["accurate"] = "eight"
+        with pytest.raises(ValueError, match="labels dictionary must be an int or float"):
+            validate_data_format(data)
+
+    def test_repeated_validation_is_cached(self, data):
+        """Test that identical payloads are only traversed once"""
+        clear_validation_cache()
+        with patch("compare_ai.actions.generate_reports._validate_data_format") as validate:
+            validate_data_format(data)
+            validate_data_format([dict(item) for item in data])
+            assert validate.call_count == 1
+
+            clear_validation_cache()
+            validate_data_format(data)
+            assert validate.call_count == 2
+
+    def test_invalid_data_is_not_cached(self, data):
+        """Test that failed validations are re-checked on every call"""
+        data[0]["models"]["gpt-4"] = "high"
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                validate_data_format(data)
+
+
+class TestGenerateReport:
+    def test_generate_report(self, data, tmp_path, monkeypatch):
+        """Test that a PDF report is written and nothing else is left on disk"""
+        monkeypatch.chdir(tmp_path)
+        pdf_file = generate_report(data)
+
+        assert pdf_file == "model_comparison_report.pdf"
+        assert (tmp_path / pdf_file).read_bytes().startswith(b"%PDF")
+        assert [path.name for path in tmp_path.iterdir()] == [pdf_file]
+        assert not (tmp_path / ".plot_cache").exists()
+
+    def test_generate_report_is_cached(self, data, tmp_path, monkeypatch):
+        """Test that a repeated report on identical data reuses the cached PDF"""
+        monkeypatch.chdir(tmp_path)
+        first = generate_report(data, max_workers=1, cache_dir="reports", plot_cache_dir="plots")
+        content = (tmp_path / first).read_bytes()
+        (tmp_path / first).unlink()
+
+        with patch("compare_ai.actions.generate_reports.generate_pdf_report") as build:
+            second = generate_report(data, max_workers=1, cache_dir="reports", plot_cache_dir="plots")
+
+        build.assert_not_called()
+        assert second == first
+        assert (tmp_path / second).read_bytes() == content
+        assert len(list((tmp_path / "plots").glob("*.png"))) == len(data)
+
+    def test_generate_report_fingerprints_once(self, data, tmp_path, monkeypatch):
+        """Test that one digest of the payload serves both report and validation caches"""
+        monkeypatch.chdir(tmp_path)
+        clear_validation_cache()
+        with patch("compare_ai.actions.generate_reports._fingerprint", wraps=_fingerprint) as fingerprint:
+            generate_report(data, max_workers=1, cache_dir="reports")
+
+        assert fingerprint.call_count == 1
+
+    def test_generate_report_releases_figures(self, data, tmp_path, monkeypatch):
+        """Test that no matplotlib figures survive report generation"""
+        monkeypatch.chdir(tmp_path)
+        generate_report(data, max_workers=1)
+
+        assert not [obj for obj in gc.get_objects() if isinstance(obj, Figure)]
+
+    def test_generate_report_in_process(self, data, tmp_path, monkeypatch):
+        """Test that plots are rendered without worker processes by default"""
+        monkeypatch.chdir(tmp_path)
+        with patch("compare_ai.actions.generate_reports.ProcessPoolExecutor") as executor:
+            pdf_file = generate_report(data)
+
+        executor.assert_not_called()
+        assert (tmp_path / pdf_file).exists()
+
+    def test_generate_report_in_worker_processes(self, data, tmp_path, monkeypatch):
+        """Test that plots are rendered in worker processes when asked to"""
+        monkeypatch.chdir(tmp_path)
+        pdf_file = generate_report(data, max_workers=2)
+
+        assert (tmp_path / pdf_file).read_bytes().startswith(b"%PDF")
+
+
+class TestGenerateMetricPlot:
+    def test_plot_is_cached(self, data, tmp_path):
+        """Test that identical metric data is rendered only once"""
+        item = data[1]
+        first = generate_metric_plot(item["name"], item["type"], item["models"], cache_dir=tmp_path)
+        assert len(list(tmp_path.glob("*.png"))) == 1
+
+        with patch("compare_ai.actions.generate_reports.FigureCanvasAgg") as plot_canvas:
+            second = generate_metric_plot(item["name"], item["type"], item["models"], cache_dir=tmp_path)
+
+        plot_canvas.assert_not_called()
+        assert first.getvalue() == second.getvalue()
+
+    def test_plot_without_cache(self, data, tmp_path, monkeypatch):
+        """Test that plots are rendered without touching disk by default"""
+        monkeypatch.chdir(tmp_path)
+        item = data[0]
+        buffer = generate_metric_plot(item["name"], item["type"], item["models"])
+
+        assert buffer.getvalue().startswith(b"\x89PNG")
+        assert not list(tmp_path.iterdir())
@@ -0,0 +1,42 @@
+import pytest
+from unittest.mock import Mock
+from compare_ai.actions import run_predictions
+from compare_ai.results_manager import Result
+
+
+class TestRunPredictions:
+    @pytest.fixture
+    def models(self):
+        echo = Mock(model_name="echo")
+        echo.predict.side_effect = lambda item: item.upper()
+
+        flaky = Mock(model_name="flaky")
+        def predict(item):
+            if item == "b":
+                raise RuntimeError("timeout")
+            return item
+        flaky.predict.side_effect = predict
+
+        return [echo, flaky]
+
+    def test_results_keep_dataset_order(self, models):
+        """Test that predictions are grouped per model in dataset order"""
+        results = run_predictions(["a", "b", "c"], models, max_workers=4)
+
+        assert [r["prediction"] for r in results["echo"]] == ["A", "B", "C"]
+        assert [r["input"] for r in results["echo"]] == ["a", "b", "c"]
+
+    def test_failed_predictions_are_skipped(self, models):
+        """Test that a failing prediction does not abort the others"""
+        results = run_predictions(["a", "b", "c"], models, max_workers=4)
+
+        assert [r["input"] for r in results["flaky"]] == ["a", "c"]
+
+    def test_predictions_are_streamed_to_file(self, models, tmp_path):
+        """Test that each successful prediction is appended to the output file"""
+        output_file = tmp_path / "predictions.jsonl"
+        run_predictions(["a", "b", "c"], models, max_workers=4, output_file=output_file)
+
+        records = list(Result.iter_from_file(output_file))
+        assert len(records) == 5
+        assert {(r["model"], r["index"]) for r in records if r["model"] == "flaky"} == {("flaky", 0), ("flaky", 2)}
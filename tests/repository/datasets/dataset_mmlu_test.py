@@ -0,0 +1,130 @@
+import pytest
+from unittest.mock import patch
+from datasets import Dataset, DatasetDict, Features, Value, Sequence, ClassLabel
+from compare_ai.repository.evaluation_datasets import MMLUDataset
+
+
+@pytest.fixture
+def mmlu():
+    """Small dataset in the cais/mmlu schema"""
+    features = Features({
+        "question": Value("string"),
+        "subject": Value("string"),
+        "choices": Sequence(Value("string")),
+        "answer": ClassLabel(names=["A", "B", "C", "D"]),
+    })
+    test = Dataset.from_dict({
+        "question": ["What is 2 + 2?", "Who wrote Hamlet?"],
+        "subject": ["elementary_mathematics", "world_literature"],
+        "choices": [["3", "4", "5", "6"], ["Marlowe", "Bacon", "Shakespeare", "Jonson"]],
+        "answer": [1, 2],
+    }, features=features)
+    return DatasetDict({"test": test})
+
+
+class TestMMLUDataset:
+    @pytest.fixture
+    def load_dataset(self, mmlu):
+        with patch("compare_ai.repository.evaluation_datasets.dataset_mmlu.load_dataset") as load:
+            load.return_value = mmlu
+            yield load
+
+    def test_load_is_lazy_and_idempotent(self, load_dataset):
+        """Test that construction does not load and repeated loads are no-ops"""
+        dataset = MMLUDataset(cache_dir=None)
+        load_dataset.assert_not_called()
+
+        dataset.load()
+        dataset.preprocess()
+        load_dataset.assert_called_once()
+
+    def test_load_and_preprocess(self, load_dataset):
+        """Test that one input set is built per system prompt"""
+        dataset = MMLUDataset(system_prompts=["", "Be precise"], cache_dir=None)
+        dataset.preprocess()
+
+        assert len(dataset.entries) == 2
+        assert len(dataset.inputs) == 2
+        assert dataset.inputs[1][0]["system_prompt"] == "Be precise"
+        assert dataset.inputs[0][0]["prompt"].startswith("Question: What is 2 + 2?")
+        assert dataset.inputs[0][0]["system_prompt"] == ""
+        assert dataset.inputs[1][0]["prompt"] == dataset.inputs[0][0]["prompt"]
+
+    def test_preprocess_builds_messages(self, load_dataset):
+        """Test that every input opens with the same system message"""
+        dataset = MMLUDataset(system_prompts=["", "Be precise"], cache_dir=None)
+        dataset.preprocess()
+
+        assert dataset.inputs[0][0]["messages"] == [{"role": "user", "content": dataset.inputs[0][0]["prompt"]}]
+        system_messages = [item["messages"][0] for item in dataset.inputs[1]]
+        assert all(message == {"role": "system", "content": "Be precise"} for message in system_messages)
+        assert dataset.inputs[1][1]["messages"][1]["content"].startswith("Question: Who wrote Hamlet?")
+
+    def test_load_uses_disk_cache(self, load_dataset, tmp_path):
+        """Test that the test split is only fetched once when caching is enabled"""
+        first = MMLUDataset(cache_dir=str(tmp_path))
+        first.load()
+        second = MMLUDataset(cache_dir=str(tmp_path))
+        second.load()
+
+        load_dataset.assert_called_once()
+        assert second.entries["question"] == first.entries["question"]
+
+    def test_load_without_cache(self, load_dataset, tmp_path, monkeypatch):
+        """Test that nothing is written to disk by default"""
+        monkeypatch.chdir(tmp_path)
+        MMLUDataset().load()
+
+        assert not list(tmp_path.iterdir())
+
+    def test_load_rebuilds_unreadable_cache(self, load_dataset, tmp_path):
+        """Test that a partial cache directory is treated as a miss"""
+        (tmp_path / "test").mkdir()
+        dataset = MMLUDataset(cache_dir=str(tmp_path))
+        dataset.load()
+
+        load_dataset.assert_called_once()
+        assert len(dataset) == 2
+        assert [path.name for path in tmp_path.iterdir()] == ["test"]
+
+        cached = MMLUDataset(cache_dir=str(tmp_path))
+        cached.load()
+        load_dataset.assert_called_once()
+        assert cached.entries["question"] == dataset.entries["question"]
+
+    def test_answers_are_letters(self, load_dataset):
+        """Test that integer answer labels are mapped to option letters"""
+        dataset = MMLUDataset(cache_dir=None)
+        dataset.load()
+
+        assert dataset.entries["answer"] == ["B", "C"]
+        assert dataset.entries["choices"][0] == ["3", "4", "5", "6"]
+
+    def test_validate(self, load_dataset):
+        """Test validation of Arrow-backed and plain list entries"""
+        dataset = MMLUDataset(cache_dir=None)
+        dataset.load()
+        assert dataset.validate()
+
+        dataset.entries = [{"question": "q", "choices": ["a", "b", "c", "d"], "answer": "E"}]
+        assert not dataset.validate()
+
+    def test_entry_access(self, load_dataset):
+        """Test row access on top of the columnar entries"""
+        dataset = MMLUDataset(cache_dir=None)
+        dataset.load()
+
+        assert len(dataset) == 2
+        assert dataset[1]["question"] == "Who wrote Hamlet?"
+        assert dataset[1]["answer"] == "C"
+
+    def test_subject_filter(self, load_dataset, tmp_path):
+        """Test that only the requested subjects are kept and cached separately"""
+        dataset = MMLUDataset(cache_dir=str(tmp_path), subjects=["world_literature"])
+        dataset.load()
+        assert dataset.entries["subject"] == ["world_literature"]
+        assert dataset.entries["answer"] == ["C"]
+
+        everything = MMLUDataset(cache_dir=str(tmp_path))
+        everything.load()
+        assert len(everything) == 2
@@ -1,14 +1,17 @@
+import asyncio
+import json
 import pytest
 from unittest.mock import Mock, patch
 from compare_ai.repository.models.model_registry import ModelRegistry
 from compare_ai.repository.models.definitions import TaskType
 from compare_ai.repository.models.models import Model, ModelCapability
-from compare_ai.repository.models.provider import Provider
+from compare_ai.repository.models.provider import BaseProvider
 
-class MockProvider(Provider):
+class MockProvider(BaseProvider):
     def __init__(self, provider_name="mock", api_key=None):
         super().__init__(api_key)
         self.provider_name = provider_name
+        self.name = provider_name
         
     def get_models(self):
         capability = ModelCapability(
@@ -29,6 +32,20 @@ class MockProvider(Provider):
     def predict(self, model_name, inputs, task):
         return ["mock response"]
 
+class PlainProvider:
+    """Provider that implements only the required members, without inheriting"""
+    name = "plain"
+
+    def get_models(self):
+        capability = ModelCapability(
+            supported_task=TaskType.TEXT_GENERATION,
+            supported_formats=["txt"]
+        )
+        return [Model(model_name="plain-model", provider=self, capability=capability)]
+
+    def predict(self, model_name, inputs, task):
+        return ["plain response"]
+
 class TestModelRegistry:
     @pytest.fixture
     def mock_provider_factory(self):
@@ -55,6 +72,126 @@ class TestModelRegistry:
         assert all(model.supports_task(TaskType.TEXT_GENERATION) for model in models)
 
 
+    def test_get_model(self, registry):
+        """Test looking up a model by name"""
+        assert registry.get_model("mock-model").model_name == "mock-model"
+        assert registry.get_model("unknown") is None
+
+
+    def test_get_model_keeps_first_registration(self, mock_provider_factory):
+        """Test that the registry resolves repeated model names like providers do"""
+        provider = MockProvider()
+        capability = ModelCapability(supported_task=TaskType.TEXT_GENERATION, supported_formats=["txt"])
+        models = [Model(model_name="mock-model", provider=provider, capability=capability) for _ in range(2)]
+        provider.get_models = Mock(return_value=models)
+        mock_provider_factory.create_provider.return_value = provider
+
+        registry = ModelRegistry()
+        assert registry.get_model("mock-model") is models[0]
+        assert registry.list_models(provider="mock") == [models[0]]
+
+
+    def test_models_shared_across_providers(self, mock_provider_factory):
+        """Test that providers listing the same model name are all kept"""
+        providers = {}
+
+        def create_provider(name, config):
+            provider = MockProvider(provider_name=name)
+            capability = ModelCapability(supported_task=TaskType.TEXT_GENERATION, supported_formats=["txt"])
+            provider.get_models = Mock(return_value=[Model(model_name="gpt-4", provider=provider, capability=capability)])
+            providers[name] = provider
+            return provider
+
+        mock_provider_factory.get_supported_providers.return_value = {"openai", "azure"}
+        mock_provider_factory.create_provider.side_effect = create_provider
+
+        registry = ModelRegistry()
+        for name in ("openai", "azure"):
+            models = registry.list_models(provider=name)
+            assert [(m.model_name, m.provider.name) for m in models] == [("gpt-4", name)]
+            assert registry.list_models(provider=name, task=TaskType.TEXT_GENERATION) == models
+        assert len(registry.list_models()) == 2
+        assert len(registry.list_models(task=TaskType.TEXT_GENERATION)) == 2
+        assert sorted(
+            (m.model_name, m.provider.name) for m in registry.find_models(task=TaskType.TEXT_GENERATION)
+        ) == [("gpt-4", "azure"), ("gpt-4", "openai")]
+
+
+    def test_list_models(self, registry):
+        """Test listing models filtered by provider and task"""
+        assert [m.model_name for m in registry.list_models()] == ["mock-model"]
+        assert len(registry.list_models(provider="mock", task=TaskType.TEXT_GENERATION)) == 1
+        assert registry.list_models(provider="unknown") == []
+
+
+    def test_model_to_json(self, registry):
+        """Test that models serialize with the provider name"""
+        data = json.loads(registry.get_model("mock-model").to_json())
+        assert data["provider"] == "mock"
+        assert data["capability"]["supported_task"] == TaskType.TEXT_GENERATION.value
+
+
+    def test_load_several_providers(self, mock_provider_factory):
+        """Test that providers are loaded concurrently and failing ones are skipped"""
+        def create_provider(name, config):
+            if name == "missing":
+                raise ImportError(name)
+            return MockProvider(provider_name=name)
+
+        mock_provider_factory.get_supported_providers.return_value = {"first", "second", "missing"}
+        mock_provider_factory.create_provider.side_effect = create_provider
+
+        registry = ModelRegistry()
+        assert registry.get_available_providers() == {"first", "second"}
+        assert set(registry._by_provider) == {"first", "second"}
+
+
+    def test_provider_with_failing_models_is_skipped(self, mock_provider_factory):
+        """Test that a provider whose model listing raises is left out entirely"""
+        broken = MockProvider(provider_name="broken")
+        broken.get_models = Mock(side_effect=RuntimeError("catalog unavailable"))
+
+        mock_provider_factory.get_supported_providers.return_value = {"mock", "broken"}
+        mock_provider_factory.create_provider.side_effect = (
+            lambda name, config: broken if name == "broken" else MockProvider()
+        )
+
+        registry = ModelRegistry()
+        assert registry.get_available_providers() == {"mock"}
+        assert registry.list_models(provider="broken") == []
+        assert registry.get_model("mock-model").provider.name == "mock"
+
+
+    def test_model_apredict(self, registry):
+        """Test that the default async path delegates to the provider's predict"""
+        model = registry.get_model("mock-model")
+        assert asyncio.run(model.apredict("Hello")) == "mock response"
+
+
+    def test_model_astream_predict(self, registry):
+        """Test that providers without streaming yield their whole prediction"""
+        async def collect():
+            return [chunk async for chunk in registry.get_model("mock-model").astream_predict("Hello")]
+
+        assert asyncio.run(collect()) == ["mock response"]
+
+
+    def test_provider_without_optional_methods(self, mock_provider_factory):
+        """Test that structural providers fall back to get_models and predict"""
+        mock_provider_factory.get_supported_providers.return_value = {"plain"}
+        mock_provider_factory.create_provider.return_value = PlainProvider()
+
+        registry = ModelRegistry()
+        model = registry.get_model("plain-model")
+        assert model is not None
+        assert asyncio.run(model.apredict("Hello")) == "plain response"
+
+        async def collect():
+            return [chunk async for chunk in model.astream_predict("Hello")]
+
+        assert asyncio.run(collect()) == ["plain response"]
+
+
     def test_get_supported_tasks(self, registry):
         """Test getting all supported tasks"""
         tasks = registry.get_supported_tasks()
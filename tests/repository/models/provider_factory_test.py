@@ -1,12 +1,12 @@
 import pytest
 from unittest.mock import patch, Mock
 from compare_ai.repository.models.provider_factory import ProviderFactory
-from compare_ai.repository.models.provider import Provider
+from compare_ai.repository.models.provider import BaseProvider
 
 class TestProviderFactory:
     @pytest.fixture
     def mock_provider_class(self):
-        class MockProvider(Provider):
+        class MockProvider(BaseProvider):
             def __init__(self, api_key=None, **kwargs):
                 super().__init__(api_key, **kwargs)
                 self.provider_name = "mock"
@@ -53,3 +53,9 @@ class TestProviderFactory:
         """Test checking if a provider is available"""
         assert ProviderFactory.is_provider_available("openai") == True
         assert ProviderFactory.is_provider_available("invalid_provider") == False
+
+    @patch("importlib.util.find_spec")
+    def test_is_provider_available_without_package(self, mock_find_spec):
+        """Test that a provider is unavailable when its package is missing"""
+        mock_find_spec.return_value = None
+        assert ProviderFactory.is_provider_available("openai") == False
@@ -1,9 +1,13 @@
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+from compare_ai.repository.models.providers import openai_provider
 from compare_ai.repository.models.providers.openai_provider import OpenaiProvider as OpenAIProvider
 from compare_ai.repository.models.definitions import TaskType
 from dotenv import load_dotenv
+import asyncio
+import json
 import os
+import sys
 
 load_dotenv()
 
@@ -14,12 +18,29 @@ class TestOpenAIProvider:
 
     @pytest.fixture
     def mock_openai(self):
-        with patch("compare_ai.repository.models.providers.openai_provider.openai") as mock:
+        mock = Mock()
+        with patch.dict(sys.modules, {"openai": mock}), patch.dict(openai_provider._CLIENTS, clear=True):
             yield mock
 
     def test_initialization(self, provider):
         assert provider.api_key == "test_key"
 
+    def test_client_is_shared_per_api_key(self, mock_openai):
+        first = OpenAIProvider(api_key="test_key")
+        second = OpenAIProvider(api_key="test_key")
+        OpenAIProvider(api_key="other_key")
+        OpenAIProvider(api_key="test_key", max_retries=0)
+
+        assert first.client is second.client
+        keys = [(call.kwargs["api_key"], call.kwargs["max_retries"])
+                for call in mock_openai.OpenAI.call_args_list]
+        assert keys == [("test_key", 5), ("other_key", 5), ("test_key", 0)]
+
+    def test_initialization_without_openai(self):
+        with patch.dict(sys.modules, {"openai": None}):
+            with pytest.raises(ImportError, match="poetry install --extras openai"):
+                OpenAIProvider(api_key="test_key")
+
     def test_get_models(self, provider):
         models = provider.get_models()
         assert len(models) > 0
@@ -30,16 +51,30 @@ class TestOpenAIProvider:
         assert isinstance(model.capability.supported_task, TaskType)
         assert isinstance(model.capability.supported_formats, list)
 
+    def test_get_models_is_cached(self, provider):
+        assert provider.get_models() is provider.get_models()
+
+    def test_iter_models_matches_get_models(self, provider):
+        streamed = list(provider.iter_models())
+        assert all(a is b for a, b in zip(streamed, provider.get_models()))
+
+    def test_get_model(self, provider):
+        assert provider.get_model("gpt-4") is provider.get_models()[0]
+        assert provider.get_model("unknown") is None
+
     def test_list_available_models(self, provider):
         models = provider._list_available_models()
-        assert isinstance(models, list)
+        assert isinstance(models, tuple)
         assert len(models) > 0
         
         # Check structure of returned model data
         first_model = models[0]
         assert "model_name" in first_model
         assert "task_support" in first_model
-        assert isinstance(first_model["task_support"], list)
+        assert isinstance(first_model["task_support"], tuple)
+
+    def test_list_available_models_is_shared(self, provider):
+        assert provider._list_available_models() is OpenAIProvider(api_key="other_key")._list_available_models()
 
     def test_predict_text_generation(self, provider, mock_openai):
         # Create a mock client instance
@@ -63,6 +98,211 @@ class TestOpenAIProvider:
 
 
 
+    def test_predict_text_generation_batch(self, provider):
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = lambda model, messages: Mock(
+            choices=[Mock(message=Mock(content=messages[0]["content"].upper()))]
+        )
+        provider.client = mock_client
+
+        inputs = [{"messages": [{"role": "user", "content": text}]} for text in ["a", "b", "c"]]
+        result = provider.predict("gpt-3.5-turbo", inputs, TaskType.TEXT_GENERATION)
+
+        assert result == ["A", "B", "C"]
+        assert mock_client.chat.completions.create.call_count == 3
+
+    def test_apredict_text_generation_batch(self, mock_openai):
+        async def create(model, messages):
+            await asyncio.sleep(0)
+            return Mock(choices=[Mock(message=Mock(content=messages[0]["content"].upper()))])
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = create
+        mock_openai.AsyncOpenAI.return_value = mock_client
+        provider = OpenAIProvider(api_key="test_key")
+
+        inputs = [{"messages": [{"role": "user", "content": text}]} for text in ["a", "b", "c"]]
+        result = asyncio.run(provider.apredict("gpt-3.5-turbo", inputs, TaskType.TEXT_GENERATION))
+
+        assert result == ["A", "B", "C"]
+        assert mock_client.chat.completions.create.call_count == 3
+
+    def test_apredict_in_successive_event_loops(self, mock_openai):
+        async def create(model, messages):
+            return Mock(choices=[Mock(message=Mock(content="ok"))])
+
+        def async_openai(**kwargs):
+            client = Mock()
+            client.chat.completions.create.side_effect = create
+            return client
+
+        mock_openai.AsyncOpenAI.side_effect = async_openai
+        provider = OpenAIProvider(api_key="test_key")
+        inputs = [{"messages": [{"role": "user", "content": "Hello"}]}]
+
+        async def predict():
+            result = await provider.apredict("gpt-3.5-turbo", inputs, TaskType.TEXT_GENERATION)
+            return result, provider.async_client
+
+        first, first_client = asyncio.run(predict())
+        second, second_client = asyncio.run(predict())
+
+        assert first == second == ["ok"]
+        assert first_client is not second_client
+        assert mock_openai.AsyncOpenAI.call_count == 2
+
+    def test_astream_predict(self, mock_openai):
+        async def events():
+            for content in ["Par", None, "is"]:
+                yield Mock(choices=[Mock(delta=Mock(content=content))])
+
+        async def create(**kwargs):
+            assert kwargs["stream"] is True
+            return events()
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = create
+        mock_openai.AsyncOpenAI.return_value = mock_client
+        provider = OpenAIProvider(api_key="test_key")
+
+        async def collect():
+            input_data = {"messages": [{"role": "user", "content": "Capital of France?"}]}
+            return [chunk async for chunk in provider.astream_predict(
+                "gpt-3.5-turbo", input_data, TaskType.TEXT_GENERATION
+            )]
+
+        assert asyncio.run(collect()) == ["Par", "is"]
+
+    def test_async_client_pool_matches_concurrency(self, mock_openai):
+        mock_openai.AsyncOpenAI.side_effect = lambda **kwargs: Mock(close=AsyncMock())
+        provider = OpenAIProvider(api_key="test_key", max_concurrency=32)
+
+        async def use_and_close():
+            client = provider.async_client
+            assert provider.async_client is client
+            await provider.aclose()
+            return client
+
+        first = asyncio.run(use_and_close())
+        second = asyncio.run(use_and_close())
+
+        assert first is not second
+        first.close.assert_awaited_once()
+        second.close.assert_awaited_once()
+        pools = [call.kwargs["limits"] for call in mock_openai.DefaultAsyncHttpxClient.call_args_list]
+        assert [limits.max_connections for limits in pools] == [32, 32]
+
+    def test_predict_deduplicates_inputs(self, provider):
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = lambda model, messages: Mock(
+            choices=[Mock(message=Mock(content=messages[0]["content"].upper()))]
+        )
+        provider.client = mock_client
+
+        inputs = [{"messages": [{"role": "user", "content": text}]} for text in ["a", "b", "a", "a"]]
+        result = provider.predict("gpt-3.5-turbo", inputs, TaskType.TEXT_GENERATION)
+
+        assert result == ["A", "B", "A", "A"]
+        assert mock_client.chat.completions.create.call_count == 2
+
+    def test_predict_sends_prompt_cache_key(self, provider):
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="Test response"))]
+        )
+        provider.client = mock_client
+
+        system = {"role": "system", "content": "Be precise"}
+        inputs = [
+            {"messages": [system, {"role": "user", "content": "a"}]},
+            {"messages": [system, {"role": "user", "content": "b"}]},
+            {"messages": [{"role": "user", "content": "c"}], "prompt_cache_key": "mmlu"},
+        ]
+        provider.predict("gpt-3.5-turbo", inputs, TaskType.TEXT_GENERATION)
+
+        keys = [call.kwargs["extra_body"]["prompt_cache_key"]
+                for call in mock_client.chat.completions.create.call_args_list]
+        assert len(set(keys[:2])) == 1
+        assert "mmlu" in keys
+
+    def test_inputs_are_grouped_by_prompt_prefix(self):
+        def message(system, user):
+            return {"messages": [{"role": "system", "content": system}, {"role": "user", "content": user}]}
+
+        inputs = [message("x", "a"), message("y", "b"), message("x", "c"), message("y", "b")]
+        unique_inputs, positions = openai_provider._dedupe_inputs(inputs)
+
+        assert unique_inputs == [inputs[0], inputs[2], inputs[1]]
+        assert [unique_inputs[position] for position in positions] == inputs
+
+    def test_prompt_cache_key_for_content_parts(self):
+        parts = [{"type": "text", "text": "Be precise"}]
+        key = openai_provider._prompt_cache_key({"messages": [{"role": "system", "content": parts}]})
+
+        assert key == openai_provider._prompt_cache_key({"messages": [{"role": "system", "content": list(parts)}]})
+        assert key != openai_provider._prompt_cache_key({"messages": [{"role": "system", "content": "Be precise"}]})
+
+    def test_predict_with_sdk_message_objects(self, tmp_path):
+        from openai.types.chat import ChatCompletionMessage
+
+        provider = OpenAIProvider(api_key="test_key", cache_dir=str(tmp_path))
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="Test response"))]
+        )
+        provider.client = mock_client
+
+        history = [
+            {"role": "user", "content": "Hello"},
+            ChatCompletionMessage(role="assistant", content="Hi"),
+            {"role": "user", "content": "Again"},
+        ]
+        inputs = [{"messages": history}, {"messages": history}]
+        result = provider.predict("gpt-3.5-turbo", inputs, TaskType.TEXT_GENERATION)
+
+        assert result == ["Test response", "Test response"]
+        assert mock_client.chat.completions.create.call_count == 2
+        assert not list(tmp_path.iterdir())
+
+    def test_predict_uses_response_cache(self, tmp_path):
+        provider = OpenAIProvider(api_key="test_key", cache_dir=str(tmp_path))
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="Test response"))]
+        )
+        provider.client = mock_client
+
+        inputs = [{"messages": [{"role": "user", "content": "Hello"}]}]
+        first = provider.predict("gpt-3.5-turbo", inputs, TaskType.TEXT_GENERATION)
+        second = provider.predict("gpt-3.5-turbo", inputs, TaskType.TEXT_GENERATION)
+
+        assert first == second == ["Test response"]
+        mock_client.chat.completions.create.assert_called_once()
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_predict_batch_api(self, provider):
+        def line(custom_id, content):
+            return json.dumps({
+                "custom_id": custom_id,
+                "response": {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}},
+            })
+
+        mock_client = Mock()
+        mock_client.batches.create.return_value = Mock(id="batch_1", status="in_progress")
+        mock_client.batches.retrieve.return_value = Mock(id="batch_1", status="completed", output_file_id="out")
+        mock_client.files.content.return_value = Mock(text="\n".join([line("1", "B"), line("0", "A")]))
+        provider.client = mock_client
+
+        inputs = [{"messages": [{"role": "user", "content": text}]} for text in ["a", "b"]]
+        with patch("compare_ai.repository.models.providers.openai_provider.time.sleep") as sleep:
+            result = provider.predict("gpt-3.5-turbo", inputs, TaskType.TEXT_GENERATION, batch_mode=True)
+
+        assert result == ["A", "B"]
+        sleep.assert_called_once()
+        mock_client.chat.completions.create.assert_not_called()
+        uploaded = mock_client.files.create.call_args.kwargs["file"][1].decode().splitlines()
+        assert json.loads(uploaded[1])["body"]["messages"] == inputs[1]["messages"]
+
     @pytest.mark.integration
     @pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="No API key provided")
     def test_batch_text_generation_integration(self):
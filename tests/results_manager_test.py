@@ -0,0 +1,34 @@
+import pytest
+from compare_ai.results_manager import Result
+
+
+class TestResult:
+    def test_save_and_load(self, tmp_path):
+        """Test that predictions survive a round trip through a file"""
+        predictions = {"gpt-4": [{"input": "Question: 2 + 2?", "prediction": "B"}]}
+        file_path = tmp_path / "results.json"
+        Result(predictions).save_to_file(file_path)
+
+        result = Result(None)
+        result.load_from_file(file_path)
+        assert result.predictions == predictions
+
+    def test_append_and_iterate(self, tmp_path):
+        """Test that appended predictions are streamed back in order"""
+        file_path = tmp_path / "results.jsonl"
+        for index in range(3):
+            Result.append({"index": index, "prediction": "A"}, file_path)
+
+        assert [record["index"] for record in Result.iter_from_file(file_path)] == [0, 1, 2]
+
+    def test_iterate_truncated_file(self, tmp_path):
+        """Test that a partially written last record is reported"""
+        file_path = tmp_path / "results.jsonl"
+        Result.append({"index": 0}, file_path)
+        with open(file_path, "a") as file:
+            file.write('{"index": 1')
+
+        records = Result.iter_from_file(file_path)
+        assert next(records) == {"index": 0}
+        with pytest.raises(ValueError, match="Truncated"):
+            next(records)